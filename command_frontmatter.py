@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Command file helpers shared by the version manager and the test framework
+
+Command files are read through a small cache keyed on path, mtime and size,
+so tools that run in the same process (e.g. validating and then bumping
+versions from a pre-commit hook) only read and split each file once.
+Callers that read every command exactly once, like the test suite, read
+the files directly instead so their text is not kept in the cache.
+"""
+
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+
+# Keyword arguments for @dataclass: slots where supported (Python 3.10+), a
+# plain __dict__ on the older versions DEVELOPMENT.md still supports
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Frontmatter delimiter line; trailing spaces or tabs are allowed
+_DELIMITER = r'---[ \t]*'
+# First line of the file is a frontmatter delimiter
+_FM_OPEN_RE = re.compile(rf'\A{_DELIMITER}(?:\r?\n|\Z)')
+# Leading YAML frontmatter block; group 1 is its body (None when empty)
+_FM_RE = re.compile(
+    rf'\A{_DELIMITER}\r?\n(?:(.*?)\r?\n)?{_DELIMITER}(?:\r?\n|\Z)', re.DOTALL
+)
+
+# (frontmatter, body_offset, content) as returned by parse_md()
+ParsedMd = Tuple[Optional[str], int, str]
+
+_MD_CACHE_SIZE = 1024
+# path -> (mtime_ns, size, parsed file)
+_md_cache: Dict[str, Tuple[int, int, ParsedMd]] = {}
+# Guards _md_cache; initialize_versions.py reads and writes from threads
+_md_cache_lock = threading.Lock()
+
+
+def split_frontmatter(content: str) -> Tuple[Optional[str], int]:
+    """Return (frontmatter, body_offset) for command file content
+
+    frontmatter is None, and body_offset 0, when the content does not start
+    with a complete ``---`` delimited block. LF and CRLF line endings are
+    both accepted.
+    """
+    match = _FM_RE.match(content)
+    if match:
+        return match.group(1) or '', match.end()
+    return None, 0
+
+
+def opens_frontmatter(content: str) -> bool:
+    """Whether content starts with a frontmatter delimiter line
+
+    True for unterminated blocks too; split_frontmatter() tells the two
+    apart.
+    """
+    return _FM_OPEN_RE.match(content) is not None
+
+
+def iter_md_entries(directory: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """Yield the directory entries of the markdown files in a directory
+
+    Matches the files ``directory.glob('*.md')`` would return (directories
+    named ``*.md`` are skipped) but works straight off the scandir results,
+    without building a Path per entry.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.md') and entry.is_file():
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
+def _cache_store(path_str: str, stat: os.stat_result, parsed: ParsedMd):
+    """Remember a parsed file, evicting the oldest entry when full"""
+    with _md_cache_lock:
+        if path_str not in _md_cache and len(_md_cache) >= _MD_CACHE_SIZE:
+            del _md_cache[next(iter(_md_cache))]
+        _md_cache[path_str] = (stat.st_mtime_ns, stat.st_size, parsed)
+
+
+def parse_md(command_path: Union[str, Path]) -> ParsedMd:
+    """Return (frontmatter, body_offset, content) for a command file
+
+    frontmatter is None when the file has no frontmatter block. Results are
+    cached until the file's mtime or size changes.
+    """
+    path_str = str(command_path)
+    stat = os.stat(path_str)
+    with _md_cache_lock:
+        cached = _md_cache.get(path_str)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    
+    content = Path(path_str).read_text(encoding='utf-8')
+    frontmatter, body_offset = split_frontmatter(content)
+    parsed = (frontmatter, body_offset, content)
+    _cache_store(path_str, stat, parsed)
+    return parsed
+
+
+def write_md(command_path: Union[str, Path], content: str):
+    """Write a command file and reseed its cache entry
+
+    Reseeding keeps a same-size rewrite within the filesystem's mtime
+    granularity from being served stale by parse_md().
+    """
+    path_str = str(command_path)
+    Path(path_str).write_text(content, encoding='utf-8')
+    frontmatter, body_offset = split_frontmatter(content)
+    _cache_store(path_str, os.stat(path_str), (frontmatter, body_offset, content))
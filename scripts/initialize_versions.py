@@ -4,11 +4,14 @@ Initialize versioning for all existing commands
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from command_frontmatter import iter_md_entries
 from version_manager import VersionManager
 
 
@@ -17,25 +20,27 @@ def main():
     repo_path = Path(__file__).parent.parent
     manager = VersionManager(repo_path)
     
-    # Initialize workflows
     workflows_dir = repo_path / 'workflows'
-    for workflow_file in workflows_dir.glob('*.md'):
-        if workflow_file.stem not in manager.metadata:
-            print(f"Initializing {workflow_file.stem}...")
-            manager.initialize_command(
-                workflow_file,
-                description=f"Workflow: {workflow_file.stem.replace('-', ' ').title()}"
-            )
-    
-    # Initialize tools
     tools_dir = repo_path / 'tools'
-    for tool_file in tools_dir.glob('*.md'):
-        if tool_file.stem not in manager.metadata:
-            print(f"Initializing {tool_file.stem}...")
-            manager.initialize_command(
-                tool_file,
-                description=f"Tool: {tool_file.stem.replace('-', ' ').title()}"
-            )
+    # Workflows take precedence if a tool shares their name
+    new_commands = {}
+    for entry in chain(iter_md_entries(workflows_dir), iter_md_entries(tools_dir)):
+        command_name = entry.name[:-len('.md')]
+        if command_name not in manager.metadata:
+            new_commands.setdefault(command_name, Path(entry.path))
+    
+    def initialize(command_file: Path):
+        kind = "Workflow" if command_file.parent == workflows_dir else "Tool"
+        print(f"Initializing {command_file.stem}...")
+        manager.initialize_command(
+            command_file,
+            description=f"{kind}: {command_file.stem.replace('-', ' ').title()}"
+        )
+    
+    # Each command file is rewritten independently, so overlap the IO and
+    # write the metadata file once at the end
+    with manager, ThreadPoolExecutor() as executor:
+        list(executor.map(initialize, new_commands.values()))
     
     # Generate initial report
     print("\n" + "="*50)
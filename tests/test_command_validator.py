@@ -0,0 +1,53 @@
+"""Tests for test_framework.CommandValidator"""
+
+import sys
+from pathlib import Path
+
+# command_frontmatter lives at the repository root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import command_frontmatter
+from test_framework import CommandTestSuite, CommandValidator
+
+
+UNCLOSED_WARNING = "Frontmatter opened with '---' is never closed"
+
+
+def _messages(content: str):
+    validator = CommandValidator(Path('tools/sample.md'), frozenset(), content=content)
+    return [r.message for r in validator.validate()]
+
+
+def test_warns_on_unclosed_frontmatter():
+    assert UNCLOSED_WARNING in _messages('---\nversion: 1.0.0\n# Title\n')
+
+
+def test_horizontal_rule_is_not_frontmatter():
+    assert UNCLOSED_WARNING not in _messages('----\n# Title\n')
+
+
+def test_delimiters_with_trailing_spaces_are_validated():
+    messages = _messages('--- \nversion: bad\n---  \n# Title\n')
+
+    assert UNCLOSED_WARNING not in messages
+    assert "Invalid version format: bad" in messages
+
+
+def test_header_jump_reports_line_number_with_crlf():
+    validator = CommandValidator(
+        Path('tools/sample.md'), frozenset(), content='# Title\r\n\r\n### Deep\r\n'
+    )
+    jumps = [r for r in validator.validate() if r.message.startswith('Header level jumps')]
+
+    assert [r.line_number for r in jumps] == [3]
+
+
+def test_suite_run_leaves_command_cache_empty(tmp_path):
+    (tmp_path / 'workflows').mkdir()
+    (tmp_path / 'tools').mkdir()
+    (tmp_path / 'workflows' / 'flow.md').write_text('# Flow\n')
+    (tmp_path / 'tools' / 'tool.md').write_text('# Tool\n')
+
+    CommandTestSuite(tmp_path).run_all_tests(max_workers=1)
+
+    assert not any(path.startswith(str(tmp_path)) for path in command_frontmatter._md_cache)
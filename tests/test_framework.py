@@ -12,19 +12,73 @@ This framework validates:
 
 import os
 import re
+import sys
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, FrozenSet, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+# Shared helpers live at the repository root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from command_frontmatter import (
+    DATACLASS_SLOTS, iter_md_entries, opens_frontmatter, parse_md, split_frontmatter
+)
+
 try:
     import yaml
     HAS_YAML = True
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
 except ImportError:
     HAS_YAML = False
 
 
+_NAME_RE = re.compile(r'^[a-z][a-z0-9-]*$')
+# Only match /command-name at word boundaries, not URLs or paths
+_CMD_REF_RE = re.compile(r'(?:^|[\s`])(/[a-z][a-z0-9-]+)(?:[\s`]|$)', re.MULTILINE)
+_SUBAGENT_RE = re.compile(r'subagent_type["\s=:]+([a-z-]+)')
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
+# One line of a file; iterating matches avoids a list of every line
+_LINE_RE = re.compile(r'^.*$', re.MULTILINE)
+
+# Common non-command patterns to exclude from reference checks
+_EXCLUDE_EXACT = frozenset({
+    'localhost', 'bin', 'bash', 'usr', 'etc', 'var', 'tmp',
+    'pre-commit', 'checkout', 'upload', 'download', 'cli',
+    'setup-node', 'workflows', 'tools', 'actions',
+    # HTML tags
+    'div', 'span', 'button', 'form', 'label', 'input',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'a',
+    'title', 'head', 'body', 'style', 'script', 'fieldset',
+    'legend', 'stopped',
+    # Common paths
+    'api', 'auth', 'user', 'admin', 'config',
+})
+_EXCLUDE_PREFIXES = tuple(sorted(_EXCLUDE_EXACT))
+
+
+@lru_cache(maxsize=1024)
+def _load_frontmatter(metadata_str: str) -> Any:
+    """Parse a frontmatter block; many commands share identical frontmatter"""
+    return yaml.load(metadata_str, Loader=_YamlLoader)
+
+
+def _scan_command_names(repo_path: Path) -> FrozenSet[str]:
+    """Collect the names of all workflow and tool commands in a repository"""
+    return frozenset(
+        entry.name[:-len('.md')]
+        for directory in ('workflows', 'tools')
+        for entry in iter_md_entries(repo_path / directory)
+    )
+
+
 class CommandType(Enum):
     WORKFLOW = "workflow"
     TOOL = "tool"
@@ -36,7 +90,7 @@ class ValidationLevel(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ValidationResult:
     level: ValidationLevel
     message: str
@@ -44,7 +98,7 @@ class ValidationResult:
     command_file: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CommandMetadata:
     name: str
     type: CommandType
@@ -63,15 +117,48 @@ class CommandMetadata:
 class CommandValidator:
     """Validates individual slash command files"""
     
-    def __init__(self, command_path: Path):
+    def __init__(self, command_path: Path,
+                 known_commands: Optional[FrozenSet[str]] = None,
+                 content: Optional[str] = None):
         self.command_path = command_path
+        self._path_str = str(command_path)
         self.command_name = command_path.stem
-        self.content = command_path.read_text()
-        self.lines = self.content.splitlines()
+        self.known_commands = known_commands
         self.results: List[ValidationResult] = []
-        
+
+        # Callers that already hold the file's text can pass it in to skip
+        # reading the file again
+        if content is None:
+            self._frontmatter, _, content = parse_md(command_path)
+        else:
+            self._frontmatter, _ = split_frontmatter(content)
+        self.content = content
+
+    def _scan(self):
+        """Collect everything the line-based checks need in one pass
+
+        Populates the state consumed by the structure, placeholder and
+        markdown validators.
+        """
+        self._has_content = False
+        self._header_levels: List[Tuple[int, int]] = []
+        self._fence_parity = 0
+        self._has_arguments = False
+        for line_number, match in enumerate(_LINE_RE.finditer(self.content), 1):
+            line = match.group()
+            if not self._has_content and line.strip():
+                self._has_content = True
+            if line.startswith('#'):
+                level = len(line) - len(line.lstrip('#'))
+                self._header_levels.append((level, line_number))
+            # Only the parity of the fence count matters
+            self._fence_parity ^= line.count('```') & 1
+            if not self._has_arguments and '$ARGUMENTS' in line:
+                self._has_arguments = True
+    
     def validate(self) -> List[ValidationResult]:
         """Run all validations on the command"""
+        self._scan()
         self._validate_structure()
         self._validate_naming()
         self._validate_placeholders()
@@ -82,29 +169,29 @@ class CommandValidator:
     
     def _validate_structure(self):
         """Validate basic command structure"""
-        if not self.content.strip():
+        if not self._has_content:
             self.results.append(ValidationResult(
                 ValidationLevel.ERROR,
                 "Command file is empty",
-                command_file=str(self.command_path)
+                command_file=self._path_str
             ))
             
         # Check for required sections
-        if not any(line.startswith('#') for line in self.lines):
+        if not self._header_levels:
             self.results.append(ValidationResult(
                 ValidationLevel.WARNING,
                 "Command should have at least one header",
-                command_file=str(self.command_path)
+                command_file=self._path_str
             ))
     
     def _validate_naming(self):
         """Validate command naming conventions"""
         # Check for lowercase-hyphen naming
-        if not re.match(r'^[a-z][a-z0-9-]*$', self.command_name):
+        if not _NAME_RE.match(self.command_name):
             self.results.append(ValidationResult(
                 ValidationLevel.ERROR,
                 f"Command name '{self.command_name}' must use lowercase-hyphen format",
-                command_file=str(self.command_path)
+                command_file=self._path_str
             ))
             
         # Check name length
@@ -112,13 +199,11 @@ class CommandValidator:
             self.results.append(ValidationResult(
                 ValidationLevel.WARNING,
                 f"Command name '{self.command_name}' is longer than 30 characters",
-                command_file=str(self.command_path)
+                command_file=self._path_str
             ))
     
     def _validate_placeholders(self):
         """Validate required placeholders"""
-        has_arguments = '$ARGUMENTS' in self.content
-        
         # Check if command likely needs arguments but doesn't have placeholder
         needs_arguments_keywords = [
             'create', 'generate', 'build', 'implement', 'add', 'modify',
@@ -126,31 +211,25 @@ class CommandValidator:
         ]
         
         if any(keyword in self.command_name for keyword in needs_arguments_keywords):
-            if not has_arguments:
+            if not self._has_arguments:
                 self.results.append(ValidationResult(
                     ValidationLevel.WARNING,
                     "Command likely needs $ARGUMENTS placeholder based on its name",
-                    command_file=str(self.command_path)
+                    command_file=self._path_str
                 ))
     
     def _validate_markdown(self):
         """Validate markdown syntax and formatting"""
         # Check for unclosed code blocks
-        code_block_count = self.content.count('```')
-        if code_block_count % 2 != 0:
+        if self._fence_parity:
             self.results.append(ValidationResult(
                 ValidationLevel.ERROR,
                 "Unclosed code block detected",
-                command_file=str(self.command_path)
+                command_file=self._path_str
             ))
-            
+
         # Check for proper header hierarchy
-        header_levels = []
-        for i, line in enumerate(self.lines):
-            if line.startswith('#'):
-                level = len(line) - len(line.lstrip('#'))
-                header_levels.append((level, i + 1))
-        
+        header_levels = self._header_levels
         for i in range(1, len(header_levels)):
             curr_level, curr_line = header_levels[i]
             prev_level, _ = header_levels[i-1]
@@ -160,77 +239,66 @@ class CommandValidator:
                     ValidationLevel.WARNING,
                     f"Header level jumps from {prev_level} to {curr_level}",
                     line_number=curr_line,
-                    command_file=str(self.command_path)
+                    command_file=self._path_str
                 ))
     
     def _validate_references(self):
         """Validate references to other commands and tools"""
-        # Find references to other commands - more selective pattern
-        # Only match /command-name at word boundaries, not URLs or paths
-        command_pattern = r'(?:^|[\s`])(/[a-z][a-z0-9-]+)(?:[\s`]|$)'
-        command_refs = re.findall(command_pattern, self.content, re.MULTILINE)
-        
-        # Common non-command patterns to exclude
-        exclude_patterns = [
-            '/localhost', '/bin', '/bash', '/usr', '/etc', '/var', '/tmp',
-            '/pre-commit', '/checkout', '/upload', '/download', '/cli',
-            '/setup-node', '/workflows', '/tools', '/actions', 
-            # HTML tags
-            '/div', '/span', '/button', '/form', '/label', '/input',
-            '/h1', '/h2', '/h3', '/h4', '/h5', '/h6', '/p', '/a',
-            '/title', '/head', '/body', '/style', '/script', '/fieldset',
-            '/legend', '/stopped',
-            # Common paths
-            '/api', '/auth', '/user', '/admin', '/config'
-        ]
+        # Find references to other commands - more selective pattern.
+        # Each distinct reference is checked (and reported) once, in order
+        # of first appearance.
+        command_refs = dict.fromkeys(
+            match.group(1)[1:] for match in _CMD_REF_RE.finditer(self.content)
+        )
         
         # Check if referenced commands exist
-        base_path = self.command_path.parent.parent
-        for ref_match in command_refs:
-            ref = ref_match.strip('/ ')
-            
+        known_commands = self.known_commands
+        if known_commands is None:
+            known_commands = _scan_command_names(self.command_path.parent.parent)
+        for ref in command_refs:
             # Skip if it's the current command
             if ref == self.command_name:
                 continue
             
             # Skip excluded patterns
-            if any(f'/{ref}' in exclude_patterns or ref.startswith(ex.lstrip('/')) for ex in exclude_patterns):
+            if ref in _EXCLUDE_EXACT or ref.startswith(_EXCLUDE_PREFIXES):
                 continue
                 
             # Check in both workflows and tools
-            workflow_path = base_path / 'workflows' / f'{ref}.md'
-            tool_path = base_path / 'tools' / f'{ref}.md'
-            
-            if not workflow_path.exists() and not tool_path.exists():
+            if ref not in known_commands:
                 self.results.append(ValidationResult(
                     ValidationLevel.WARNING,
                     f"Referenced command '/{ref}' not found",
-                    command_file=str(self.command_path)
+                    command_file=self._path_str
                 ))
     
     def _validate_metadata(self):
         """Validate command metadata if present"""
+        if self._frontmatter is None and opens_frontmatter(self.content):
+            self.results.append(ValidationResult(
+                ValidationLevel.WARNING,
+                "Frontmatter opened with '---' is never closed",
+                command_file=self._path_str
+            ))
+            
         # Look for metadata in YAML frontmatter
-        if self.content.startswith('---') and HAS_YAML:
+        if self._frontmatter is not None and HAS_YAML:
             try:
-                end_index = self.content.find('---', 3)
-                if end_index != -1:
-                    metadata_str = self.content[3:end_index]
-                    metadata = yaml.safe_load(metadata_str)
-                    
-                    # Validate version format
-                    if 'version' in metadata:
-                        if not re.match(r'^\d+\.\d+\.\d+$', str(metadata['version'])):
-                            self.results.append(ValidationResult(
-                                ValidationLevel.ERROR,
-                                f"Invalid version format: {metadata['version']}",
-                                command_file=str(self.command_path)
-                            ))
+                metadata = _load_frontmatter(self._frontmatter)
+                
+                # Validate version format
+                if isinstance(metadata, dict) and 'version' in metadata:
+                    if not _SEMVER_RE.match(str(metadata['version'])):
+                        self.results.append(ValidationResult(
+                            ValidationLevel.ERROR,
+                            f"Invalid version format: {metadata['version']}",
+                            command_file=self._path_str
+                        ))
             except yaml.YAMLError as e:
                 self.results.append(ValidationResult(
                     ValidationLevel.ERROR,
                     f"Invalid YAML frontmatter: {e}",
-                    command_file=str(self.command_path)
+                    command_file=self._path_str
                 ))
 
 
@@ -251,7 +319,7 @@ class WorkflowValidator(CommandValidator):
             self.results.append(ValidationResult(
                 ValidationLevel.WARNING,
                 "Workflow should use Task tool for subagent coordination",
-                command_file=str(self.command_path)
+                command_file=self._path_str
             ))
             
         # Check for proper subagent_type specification
@@ -259,14 +327,13 @@ class WorkflowValidator(CommandValidator):
             self.results.append(ValidationResult(
                 ValidationLevel.WARNING,
                 "Workflow using Task tool should specify subagent_type",
-                command_file=str(self.command_path)
+                command_file=self._path_str
             ))
     
     def _validate_subagent_references(self):
         """Validate references to valid subagent types"""
         # Extract subagent types mentioned
-        subagent_pattern = r'subagent_type["\s=:]+([a-z-]+)'
-        subagent_refs = re.findall(subagent_pattern, self.content)
+        subagent_refs = _SUBAGENT_RE.findall(self.content)
         
         # Known valid subagent types (from the documentation)
         valid_subagents = {
@@ -281,10 +348,41 @@ class WorkflowValidator(CommandValidator):
                 self.results.append(ValidationResult(
                     ValidationLevel.WARNING,
                     f"Unknown subagent type: {subagent}",
-                    command_file=str(self.command_path)
+                    command_file=self._path_str
                 ))
 
 
+# Validating a file takes about a millisecond, so a process pool only
+# pays for its startup on trees with a few hundred commands
+_POOL_MIN_FILES = 256
+
+# Set once per worker process by _init_worker
+_worker_known_commands: FrozenSet[str] = frozenset()
+
+
+def _init_worker(known_commands: FrozenSet[str]):
+    """Give a worker process the command names shared by every job"""
+    global _worker_known_commands
+    _worker_known_commands = known_commands
+
+
+def _validate_file(command_path: str, validator_cls: type,
+                   known_commands: FrozenSet[str]) -> List[ValidationResult]:
+    """Validate a command file that is read exactly once
+
+    The file is read directly rather than through parse_md(), so a run over
+    every command does not leave their text in the shared cache.
+    """
+    path = Path(command_path)
+    content = path.read_text(encoding='utf-8')
+    return validator_cls(path, known_commands, content=content).validate()
+
+
+def _validate_one(command_path: str, validator_cls: type) -> List[ValidationResult]:
+    """Validate a single command file (top-level so worker processes can pickle it)"""
+    return _validate_file(command_path, validator_cls, _worker_known_commands)
+
+
 class CommandTestSuite:
     """Test suite for validating all commands in the repository"""
     
@@ -294,23 +392,53 @@ class CommandTestSuite:
         self.tools_path = repo_path / 'tools'
         self.results: Dict[str, List[ValidationResult]] = {}
         
-    def run_all_tests(self) -> Dict[str, List[ValidationResult]]:
-        """Run validation on all commands"""
-        # Validate workflows
-        for workflow_file in self.workflows_path.glob('*.md'):
-            validator = WorkflowValidator(workflow_file)
-            self.results[str(workflow_file)] = validator.validate()
-            
-        # Validate tools
-        for tool_file in self.tools_path.glob('*.md'):
-            validator = CommandValidator(tool_file)
-            self.results[str(tool_file)] = validator.validate()
+    def run_all_tests(self, max_workers: Optional[int] = None) -> Dict[str, List[ValidationResult]]:
+        """Run validation on all commands
+
+        Files are validated in-process by default and spread across a
+        process pool only when there are at least _POOL_MIN_FILES of them.
+        An explicit max_workers > 1 always uses the pool; max_workers=1
+        never does.
+        """
+        # List the command directories once so reference checks are lookups
+        known_commands = _scan_command_names(self.repo_path)
+
+        # Validate workflows, then tools
+        jobs = [
+            (entry.path, WorkflowValidator)
+            for entry in iter_md_entries(self.workflows_path)
+        ] + [
+            (entry.path, CommandValidator)
+            for entry in iter_md_entries(self.tools_path)
+        ]
+
+        if max_workers is None:
+            use_pool = len(jobs) >= _POOL_MIN_FILES and (os.cpu_count() or 1) > 1
+        else:
+            use_pool = max_workers > 1 and len(jobs) > 1
+
+        if use_pool:
+            paths = [path for path, _ in jobs]
+            validator_classes = [validator_cls for _, validator_cls in jobs]
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=(known_commands,)) as executor:
+                file_results = list(executor.map(_validate_one, paths, validator_classes))
+        else:
+            file_results = [
+                _validate_file(path, validator_cls, known_commands)
+                for path, validator_cls in jobs
+            ]
+
+        for (path, _), results in zip(jobs, file_results):
+            self.results[path] = results
             
         return self.results
     
     def generate_report(self) -> str:
         """Generate a human-readable test report"""
-        report_lines = ["# Command Validation Report\n"]
+        # Per-file sections are built first; the summary that precedes
+        # them is assembled once the totals are known
+        body_lines = []
         
         total_errors = 0
         total_warnings = 0
@@ -320,16 +448,17 @@ class CommandTestSuite:
             if not results:
                 continue
                 
-            file_errors = [r for r in results if r.level == ValidationLevel.ERROR]
-            file_warnings = [r for r in results if r.level == ValidationLevel.WARNING]
-            file_info = [r for r in results if r.level == ValidationLevel.INFO]
+            file_errors = [r for r in results if r.level is ValidationLevel.ERROR]
+            file_warnings = [r for r in results if r.level is ValidationLevel.WARNING]
+            file_info = [r for r in results if r.level is ValidationLevel.INFO]
             
             total_errors += len(file_errors)
             total_warnings += len(file_warnings)
             total_info += len(file_info)
             
             if file_errors or file_warnings:
-                report_lines.append(f"\n## {Path(file_path).name}")
+                body_lines.append("")
+                body_lines.append(f"## {Path(file_path).name}")
                 
                 for result in results:
                     icon = {
@@ -339,17 +468,22 @@ class CommandTestSuite:
                     }[result.level]
                     
                     line_info = f" (line {result.line_number})" if result.line_number else ""
-                    report_lines.append(f"- {icon} {result.message}{line_info}")
+                    body_lines.append(f"- {icon} {result.message}{line_info}")
         
         # Summary
-        report_lines.insert(1, f"\n## Summary")
-        report_lines.insert(2, f"- Total Commands: {len(self.results)}")
-        report_lines.insert(3, f"- ❌ Errors: {total_errors}")
-        report_lines.insert(4, f"- ⚠️  Warnings: {total_warnings}")
-        report_lines.insert(5, f"- ℹ️  Info: {total_info}")
-        report_lines.insert(6, "")
+        header_lines = [
+            "# Command Validation Report",
+            "",
+            "",
+            "## Summary",
+            f"- Total Commands: {len(self.results)}",
+            f"- ❌ Errors: {total_errors}",
+            f"- ⚠️  Warnings: {total_warnings}",
+            f"- ℹ️  Info: {total_info}",
+            "",
+        ]
         
-        return "\n".join(report_lines)
+        return "\n".join(header_lines + body_lines)
     
     def save_report(self, output_path: Path):
         """Save validation report to file"""
@@ -358,10 +492,11 @@ class CommandTestSuite:
         
     def get_exit_code(self) -> int:
         """Get exit code based on validation results"""
-        for results in self.results.values():
-            if any(r.level == ValidationLevel.ERROR for r in results):
-                return 1
-        return 0
+        return 1 if any(
+            r.level is ValidationLevel.ERROR
+            for results in self.results.values()
+            for r in results
+        ) else 0
 
 
 def main():
@@ -373,12 +508,15 @@ def main():
     parser.add_argument('--output', help='Output file for validation report')
     parser.add_argument('--format', choices=['text', 'json'], default='text', 
                        help='Output format')
+    parser.add_argument('--jobs', type=int,
+                       help='Number of worker processes (default: in-process unless '
+                            'there are many commands; 1 disables parallelism)')
     
     args = parser.parse_args()
     
     repo_path = Path(args.path).resolve()
     test_suite = CommandTestSuite(repo_path)
-    results = test_suite.run_all_tests()
+    results = test_suite.run_all_tests(max_workers=args.jobs)
     
     if args.format == 'json':
         # Convert results to JSON-serializable format
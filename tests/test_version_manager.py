@@ -0,0 +1,120 @@
+"""Tests for version_manager.VersionManager"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# version_manager lives at the repository root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import command_frontmatter
+import version_manager
+from command_frontmatter import parse_md
+from version_manager import CommandMetadata, CommandVersion, VersionManager
+
+
+def test_update_command_file_rewrites_version_in_place(tmp_path):
+    command_path = tmp_path / 'tools' / 'sample.md'
+    command_path.parent.mkdir()
+    command_path.write_text('---\ndescription: x\nversion: 0.9.0\n---\n# T\n')
+
+    VersionManager(tmp_path)._update_command_file(command_path, '1.0.0')
+
+    assert command_path.read_text() == '---\ndescription: x\nversion: 1.0.0\n---\n# T\n'
+
+
+def test_update_command_file_accepts_trailing_whitespace_on_delimiters(tmp_path):
+    command_path = tmp_path / 'tools' / 'sample.md'
+    command_path.parent.mkdir()
+    command_path.write_text('--- \ndescription: x\nversion: 0.9.0\n---   \n# T\n')
+
+    VersionManager(tmp_path)._update_command_file(command_path, '1.0.0')
+
+    assert command_path.read_text() == '---\ndescription: x\nversion: 1.0.0\n---\n# T\n'
+
+
+def test_update_command_file_adds_frontmatter_when_missing(tmp_path):
+    command_path = tmp_path / 'tools' / 'sample.md'
+    command_path.parent.mkdir()
+    command_path.write_text('# T\n')
+
+    VersionManager(tmp_path)._update_command_file(command_path, '1.0.0')
+
+    assert command_path.read_text() == '---\nversion: 1.0.0\n---\n# T\n'
+
+
+def test_update_command_file_refreshes_cached_content(tmp_path):
+    command_path = tmp_path / 'tools' / 'sample.md'
+    command_path.parent.mkdir()
+    command_path.write_text('---\nversion: 1.0.1\n---\n# T\n')
+    stat = command_path.stat()
+    assert parse_md(command_path)[2] == '---\nversion: 1.0.1\n---\n# T\n'
+
+    VersionManager(tmp_path)._update_command_file(command_path, '1.0.2')
+    # Simulate a filesystem whose mtime did not move for the same-size rewrite
+    os.utime(command_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert parse_md(command_path)[2] == '---\nversion: 1.0.2\n---\n# T\n'
+
+
+def test_failed_json_save_keeps_previous_metadata(tmp_path, monkeypatch):
+    monkeypatch.setattr(version_manager, 'HAS_ORJSON', False)
+    metadata_file = tmp_path / '.command-metadata.json'
+    metadata_file.write_text('{}')
+    manager = VersionManager(tmp_path)
+    manager.metadata['sample'] = CommandMetadata(
+        name='sample', type='tool', description='', current_version='1.0.0',
+        created='', last_updated='', tags=[], dependencies=[],
+        version_history=[object()]
+    )
+
+    with pytest.raises(TypeError):
+        manager._write_metadata()
+
+    assert metadata_file.read_text() == '{}'
+
+
+def test_concurrent_updates_evict_safely(tmp_path, monkeypatch):
+    monkeypatch.setattr(command_frontmatter, '_MD_CACHE_SIZE', 4)
+    monkeypatch.setattr(command_frontmatter, '_md_cache', {})
+    (tmp_path / 'tools').mkdir()
+    paths = []
+    for i in range(64):
+        path = tmp_path / 'tools' / f'cmd-{i}.md'
+        path.write_text('---\nversion: 1.0.0\n---\n# T\n')
+        paths.append(path)
+    manager = VersionManager(tmp_path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda path: manager._update_command_file(path, '1.0.1'), paths))
+
+    assert len(command_frontmatter._md_cache) <= 4
+    assert all('version: 1.0.1' in path.read_text() for path in paths)
+
+
+def test_render_changelog_preserves_existing_history(tmp_path):
+    changelog_path = tmp_path / 'CHANGELOG.md'
+    changelog_path.write_text(
+        "# Claude Code Commands Changelog\n"
+        "\n## [old] 0.9.0 - 2024-01-01\n\n### Changes\n- Hand-written entry\n"
+    )
+    manager = VersionManager(tmp_path)
+    manager._update_changelog('sample', '1.0.0', '1.1.0', CommandVersion(
+        version='1.1.0', released='2026-01-02T00:00:00', changes=['New option']
+    ))
+
+    manager.render_changelog()
+    content = changelog_path.read_text()
+
+    assert content.startswith("# Claude Code Commands Changelog\n\n## [sample] 1.1.0 - 2026-01-02\n")
+    assert "- New option" in content
+    assert "## [old] 0.9.0 - 2024-01-01" in content
+    assert "- Hand-written entry" in content
+    assert content.index("[sample] 1.1.0") < content.index("[old] 0.9.0")
+
+    # Rendering again must not duplicate generated or preserved entries
+    manager.render_changelog()
+    assert changelog_path.read_text() == content
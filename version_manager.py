@@ -7,12 +7,27 @@ Manages semantic versioning for commands and tracks changes.
 
 import json
 import re
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from command_frontmatter import DATACLASS_SLOTS, parse_md, write_md
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+_VER_SUB_RE = re.compile(r'version:\s*[\d.]+')
+# Separates entries rendered from the changelog log from older history in
+# CHANGELOG.md, which is kept as-is below it
+_CHANGELOG_MARKER = "<!-- Entries above are generated from .changelog.jsonl; earlier history follows -->"
+
 
 class ChangeType(Enum):
     MAJOR = "major"  # Breaking changes
@@ -20,7 +35,7 @@ class ChangeType(Enum):
     PATCH = "patch"  # Bug fixes
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CommandVersion:
     """Represents a command's version information"""
     version: str
@@ -36,7 +51,7 @@ class CommandVersion:
             self.deprecated_features = []
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CommandMetadata:
     """Complete metadata for a command"""
     name: str
@@ -56,12 +71,31 @@ class VersionManager:
     def __init__(self, repo_path: Path):
         self.repo_path = repo_path
         self.metadata_file = repo_path / '.command-metadata.json'
+        self.changelog_log_file = repo_path / '.changelog.jsonl'
         self.metadata = self._load_metadata()
+        # Guards metadata and the metadata file when commands are
+        # initialized from several threads
+        self._lock = threading.Lock()
+        # Inside a ``with manager:`` block saves are deferred until exit
+        self._autosave = True
+        self._dirty = False
+    
+    def __enter__(self):
+        self._autosave = False
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._autosave = True
+        self.flush()
+        return False
         
     def _load_metadata(self) -> Dict[str, CommandMetadata]:
         """Load command metadata from file"""
         if self.metadata_file.exists():
-            data = json.loads(self.metadata_file.read_text())
+            if HAS_ORJSON:
+                data = orjson.loads(self.metadata_file.read_bytes())
+            else:
+                data = json.loads(self.metadata_file.read_text(encoding='utf-8'))
             return {
                 name: CommandMetadata(**cmd_data)
                 for name, cmd_data in data.items()
@@ -69,19 +103,40 @@ class VersionManager:
         return {}
     
     def _save_metadata(self):
-        """Save metadata to file"""
-        data = {
-            name: asdict(metadata)
-            for name, metadata in self.metadata.items()
-        }
-        self.metadata_file.write_text(json.dumps(data, indent=2))
+        """Save metadata to file, or mark it dirty while saves are deferred"""
+        if not self._autosave:
+            self._dirty = True
+            return
+        self._write_metadata()
+    
+    def _write_metadata(self):
+        """Write metadata to file"""
+        # Both encoders serialize the dataclasses directly. The document is
+        # built in full before the file is opened, so an encoding error
+        # leaves the previous metadata in place
+        if HAS_ORJSON:
+            self.metadata_file.write_bytes(
+                orjson.dumps(self.metadata, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            self.metadata_file.write_text(
+                json.dumps(self.metadata, indent=2, ensure_ascii=False, default=asdict),
+                encoding='utf-8'
+            )
+        self._dirty = False
+    
+    def flush(self):
+        """Write any deferred metadata changes to file"""
+        with self._lock:
+            if self._dirty:
+                self._write_metadata()
     
     def _parse_version(self, version: str) -> Tuple[int, int, int]:
         """Parse semantic version string"""
-        match = re.match(r'^(\d+)\.(\d+)\.(\d+)$', version)
-        if not match:
+        parts = version.split('.')
+        if len(parts) != 3 or not all(part.isdecimal() for part in parts):
             raise ValueError(f"Invalid version format: {version}")
-        return tuple(int(x) for x in match.groups())
+        return int(parts[0]), int(parts[1]), int(parts[2])
     
     def _increment_version(self, version: str, change_type: ChangeType) -> str:
         """Increment version based on change type"""
@@ -97,32 +152,35 @@ class VersionManager:
     def initialize_command(self, command_path: Path, description: str = "",
                           tags: List[str] = None, dependencies: List[str] = None):
         """Initialize versioning for a new command"""
+        now_iso = datetime.now().isoformat()
         command_name = command_path.stem
         command_type = "workflow" if "workflows" in str(command_path) else "tool"
         
-        if command_name in self.metadata:
-            print(f"Command {command_name} already initialized")
-            return
+        with self._lock:
+            if command_name in self.metadata:
+                print(f"Command {command_name} already initialized")
+                return
         
-        self.metadata[command_name] = CommandMetadata(
-            name=command_name,
-            type=command_type,
-            description=description,
-            current_version="1.0.0",
-            created=datetime.now().isoformat(),
-            last_updated=datetime.now().isoformat(),
-            tags=tags or [],
-            dependencies=dependencies or [],
-            version_history=[
-                CommandVersion(
-                    version="1.0.0",
-                    released=datetime.now().isoformat(),
-                    changes=["Initial release"]
-                )
-            ]
-        )
+            self.metadata[command_name] = CommandMetadata(
+                name=command_name,
+                type=command_type,
+                description=description,
+                current_version="1.0.0",
+                created=now_iso,
+                last_updated=now_iso,
+                tags=tags or [],
+                dependencies=dependencies or [],
+                version_history=[
+                    CommandVersion(
+                        version="1.0.0",
+                        released=now_iso,
+                        changes=["Initial release"]
+                    )
+                ]
+            )
         
-        self._save_metadata()
+            self._save_metadata()
+
         self._update_command_file(command_path, "1.0.0")
         print(f"Initialized {command_name} at version 1.0.0")
     
@@ -130,6 +188,7 @@ class VersionManager:
                       changes: List[str], breaking_changes: List[str] = None,
                       deprecated_features: List[str] = None):
         """Update command version"""
+        now_iso = datetime.now().isoformat()
         if command_name not in self.metadata:
             raise ValueError(f"Command {command_name} not found in metadata")
         
@@ -140,7 +199,7 @@ class VersionManager:
         # Create version entry
         version_entry = CommandVersion(
             version=new_version,
-            released=datetime.now().isoformat(),
+            released=now_iso,
             changes=changes,
             breaking_changes=breaking_changes or [],
             deprecated_features=deprecated_features or []
@@ -148,7 +207,7 @@ class VersionManager:
         
         # Update metadata
         metadata.current_version = new_version
-        metadata.last_updated = datetime.now().isoformat()
+        metadata.last_updated = now_iso
         metadata.version_history.append(version_entry)
         
         # Save and update file
@@ -163,6 +222,7 @@ class VersionManager:
         
         # Generate changelog entry
         self._update_changelog(command_name, old_version, new_version, version_entry)
+        print("Run 'version_manager.py changelog' to update CHANGELOG.md")
     
     def _find_command_file(self, command_name: str) -> Optional[Path]:
         """Find the command file path"""
@@ -174,78 +234,117 @@ class VersionManager:
     
     def _update_command_file(self, command_path: Path, version: str):
         """Update version in command file"""
-        content = command_path.read_text()
+        frontmatter, body_offset, content = parse_md(command_path)
         
         # Check if file has YAML frontmatter
-        if content.startswith('---'):
+        if frontmatter is not None:
             # Update existing frontmatter
-            end_index = content.find('---', 3)
-            if end_index != -1:
-                frontmatter = content[3:end_index]
-                # Simple version update (proper YAML parsing would be better)
-                if 'version:' in frontmatter:
-                    frontmatter = re.sub(
-                        r'version:\s*[\d.]+',
-                        f'version: {version}',
-                        frontmatter
-                    )
-                else:
-                    frontmatter = f"{frontmatter.rstrip()}\nversion: {version}\n"
-                
-                new_content = f"---{frontmatter}---{content[end_index+3:]}"
+            # Simple version update (proper YAML parsing would be better)
+            if 'version:' in frontmatter:
+                frontmatter = _VER_SUB_RE.sub(f'version: {version}', frontmatter)
             else:
-                # Invalid frontmatter, add new one
-                new_content = f"---\nversion: {version}\n---\n{content}"
+                frontmatter = f"{frontmatter.rstrip()}\nversion: {version}".lstrip('\n')
+            
+            new_content = f"---\n{frontmatter}\n---\n{content[body_offset:]}"
         else:
-            # Add frontmatter
+            # No (or unterminated) frontmatter, add a new block
             new_content = f"---\nversion: {version}\n---\n{content}"
         
-        command_path.write_text(new_content)
+        write_md(command_path, new_content)
     
     def _update_changelog(self, command_name: str, old_version: str, 
                          new_version: str, version_entry: CommandVersion):
-        """Update CHANGELOG.md with version information"""
-        changelog_path = self.repo_path / 'CHANGELOG.md'
+        """Append a version change to the changelog log
         
-        # Create changelog entry
+        Entries are only appended here; CHANGELOG.md is rebuilt from the
+        log by render_changelog().
+        """
+        record = {
+            'command': command_name,
+            'old_version': old_version,
+            'version': new_version,
+            'released': version_entry.released,
+            'changes': version_entry.changes,
+            'breaking_changes': version_entry.breaking_changes,
+            'deprecated_features': version_entry.deprecated_features,
+        }
+        if HAS_ORJSON:
+            line = orjson.dumps(record) + b'\n'
+        else:
+            line = json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+        with self.changelog_log_file.open('ab') as f:
+            f.write(line)
+    
+    def _format_changelog_entry(self, record: dict) -> str:
+        """Format one changelog log record as markdown"""
         entry_lines = [
-            f"\n## [{command_name}] {new_version} - {datetime.now().strftime('%Y-%m-%d')}\n"
+            f"\n## [{record['command']}] {record['version']} - {record['released'][:10]}\n"
         ]
         
-        if version_entry.breaking_changes:
+        if record['breaking_changes']:
             entry_lines.append("\n### Breaking Changes\n")
-            for change in version_entry.breaking_changes:
+            for change in record['breaking_changes']:
                 entry_lines.append(f"- {change}\n")
         
-        if version_entry.changes:
+        if record['changes']:
             entry_lines.append("\n### Changes\n")
-            for change in version_entry.changes:
+            for change in record['changes']:
                 entry_lines.append(f"- {change}\n")
         
-        if version_entry.deprecated_features:
+        if record['deprecated_features']:
             entry_lines.append("\n### Deprecated\n")
-            for feature in version_entry.deprecated_features:
+            for feature in record['deprecated_features']:
                 entry_lines.append(f"- {feature}\n")
         
-        entry = "".join(entry_lines)
+        return "".join(entry_lines)
+    
+    def _split_changelog(self, content: str) -> Tuple[str, str]:
+        """Split an existing CHANGELOG.md into its title and earlier history
+        
+        Entries rendered by a previous render_changelog() call are dropped
+        from the history since they are regenerated from the log.
+        """
+        lines = content.split('\n')
+        title_end = next(
+            (i + 1 for i, line in enumerate(lines) if line.startswith('# ')), 0
+        )
+        title = '\n'.join(lines[:title_end])
+        history = '\n'.join(lines[title_end:])
+        if _CHANGELOG_MARKER in history:
+            history = history.split(_CHANGELOG_MARKER, 1)[1]
+        return title, history.strip('\n')
+    
+    def render_changelog(self) -> Path:
+        """Write CHANGELOG.md from the changelog log, newest entries first
         
-        # Update or create changelog
+        Anything already in CHANGELOG.md that did not come from the log
+        (entries written by older versions of this tool, hand-written
+        notes) is preserved below the generated entries.
+        """
+        changelog_path = self.repo_path / 'CHANGELOG.md'
+        
+        title, history = "", ""
         if changelog_path.exists():
-            content = changelog_path.read_text()
-            # Insert after header
-            lines = content.split('\n')
-            insert_index = 0
-            for i, line in enumerate(lines):
-                if line.startswith('# '):
-                    insert_index = i + 1
-                    break
-            
-            lines.insert(insert_index, entry)
-            changelog_path.write_text('\n'.join(lines))
-        else:
-            # Create new changelog
-            changelog_content = f"# Claude Code Commands Changelog\n{entry}"
-            changelog_path.write_text(changelog_content)
+            title, history = self._split_changelog(changelog_path.read_text(encoding='utf-8'))
+        title = title or "# Claude Code Commands Changelog"
+        
+        records = []
+        if self.changelog_log_file.exists():
+            with self.changelog_log_file.open('rb') as f:
+                for line in f:
+                    if line.strip():
+                        records.append(orjson.loads(line) if HAS_ORJSON else json.loads(line))
+        
+        # Sorting is stable, so reverse first to keep later entries first
+        # among those released at the same moment
+        records = sorted(reversed(records), key=lambda r: r['released'], reverse=True)
+        
+        entries = "".join(self._format_changelog_entry(r) for r in records)
+        content = f"{title}\n{entries}\n{_CHANGELOG_MARKER}\n"
+        if history:
+            content += f"\n{history}\n"
+        changelog_path.write_text(content, encoding='utf-8')
+        return changelog_path
     
     def check_compatibility(self, command_name: str, required_version: str) -> bool:
         """Check if current command version satisfies requirement"""
@@ -315,6 +414,9 @@ def main():
     # Generate report
     report_parser = subparsers.add_parser('report', help='Generate version report')
     
+    # Render changelog
+    changelog_parser = subparsers.add_parser('changelog', help='Write CHANGELOG.md from recorded version changes')
+    
     args = parser.parse_args()
     
     if not args.action:
@@ -341,6 +443,9 @@ def main():
         )
     elif args.action == 'report':
         print(manager.generate_version_report())
+    elif args.action == 'changelog':
+        changelog_path = manager.render_changelog()
+        print(f"Changelog written to: {changelog_path}")
 
 
 if __name__ == '__main__':